@@ -1,8 +1,12 @@
 import asyncio
+import gc
+import weakref
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timezone
-from enum import Enum, auto
+from decimal import Decimal
+from enum import Enum, IntEnum, auto
 from pathlib import Path
+from typing import NewType
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
@@ -10,6 +14,7 @@ import pytest
 
 from trame_server import Server
 from trame_server.utils.typed_state import (
+    CollectionEncoderDecoder,
     DefaultEncoderDecoder,
     IStateEncoderDecoder,
     TypedState,
@@ -170,6 +175,70 @@ def test_can_customize_encoders_and_decoders(state):
     assert typed_state.data.my_enum == 42
 
 
+def test_default_encoder_handles_exact_types_and_subclasses():
+    class MyIntEnum(IntEnum):
+        A = 1
+
+    class MyDateTime(datetime):
+        pass
+
+    encoder = DefaultEncoderDecoder()
+    dt = MyDateTime.now(tz=timezone.utc)
+
+    assert encoder.encode(Decimal("1.5")) == "1.5"
+    assert encoder.encode(MyIntEnum.A) == 1
+    assert encoder.encode(dt) == dt.isoformat()
+    assert encoder.encode(Path(__file__)) == Path(__file__).as_posix()
+    assert encoder.decode("1.5", Decimal) == Decimal("1.5")
+    assert encoder.decode(dt.isoformat(), datetime) == dt
+    assert isinstance(encoder.decode(dt.isoformat(), MyDateTime), MyDateTime)
+
+
+def test_encoders_can_skip_unhandled_values(state):
+    class EnumOnlyEncoder(IStateEncoderDecoder):
+        def can_encode(self, obj) -> bool:
+            return isinstance(obj, MyEnum)
+
+        def can_decode(self, _obj, obj_type: type) -> bool:
+            return obj_type is MyEnum
+
+        def encode(self, obj):
+            return obj.name
+
+        def decode(self, obj, _obj_type: type):
+            return MyEnum[obj]
+
+    typed_state = TypedState(
+        state, DataWithTypes, encoders=[EnumOnlyEncoder(), DefaultEncoderDecoder()]
+    )
+    typed_state.data.my_enum = MyEnum.B
+    typed_state.data.my_date = date(2024, 1, 2)
+
+    assert state[typed_state.name.my_enum] == "B"
+    assert state[typed_state.name.my_date] == "2024-01-02"
+    assert typed_state.data.my_enum == MyEnum.B
+    assert typed_state.data.my_date == date(2024, 1, 2)
+
+
+UserId = NewType("UserId", int)
+
+
+def test_default_encoder_subclasses_can_decode_non_class_types(state):
+    class UserIdDecoder(DefaultEncoderDecoder):
+        def decode(self, obj, obj_type: type):
+            if obj_type is UserId:
+                return UserId(int(obj))
+            return super().decode(obj, obj_type)
+
+    @dataclass
+    class User:
+        user_id: UserId = UserId(0)
+
+    typed_state = TypedState(state, User, encoders=[UserIdDecoder()])
+    state[typed_state.name.user_id] = "3"
+    assert typed_state.data.user_id == 3
+
+
 @dataclass
 class MyDataWithFactory:
     a: list[MyEnum] = field(default_factory=lambda: [MyEnum.A, MyEnum.B])
@@ -180,6 +249,41 @@ def test_is_compatible_with_default_factory(state):
     assert state[typed_state.name.a] == [MyEnum.A.value, MyEnum.B.value]
 
 
+@dataclass
+class MyDataWithDefaults:
+    a: tuple[MyEnum, ...] = (MyEnum.A, MyEnum.C)
+    b: list[MyEnum] = field(default_factory=lambda: [MyEnum.B])
+    c: tuple[list[int], ...] = ([1, 2],)
+
+
+def test_defaults_are_encoded_for_each_namespace(state):
+    typed_state_1 = TypedState(state, MyDataWithDefaults, namespace="ns1")
+    typed_state_2 = TypedState(state, MyDataWithDefaults, namespace="ns2")
+
+    for typed_state in (typed_state_1, typed_state_2):
+        assert state[typed_state.name.a] == (MyEnum.A.value, MyEnum.C.value)
+        assert state[typed_state.name.b] == [MyEnum.B.value]
+        assert state[typed_state.name.c] == ([1, 2],)
+
+    assert state[typed_state_1.name.b] is not state[typed_state_2.name.b]
+    assert state[typed_state_1.name.c][0] is not state[typed_state_2.name.c][0]
+
+
+def test_equal_defaults_of_different_types_are_encoded_separately(state):
+    @dataclass
+    class A:
+        a: tuple[int, ...] = (1,)
+
+    @dataclass
+    class B:
+        b: tuple[bool, ...] = (True,)
+
+    a = TypedState(state, A)
+    b = TypedState(state, B)
+    assert type(state[a.name.a][0]) is int
+    assert type(state[b.name.b][0]) is bool
+
+
 def test_different_data_classes_with_same_name_are_not_mangled_by_default(state):
     @dataclass
     class A:
@@ -406,6 +510,28 @@ def test_handles_union_types_by_order_of_definition(state):
     assert state[typed_state.name.my_enum_or_str] == b_str
 
 
+def test_union_decoding_order_is_not_shared_between_equal_unions(state):
+    @dataclass
+    class StrFirst:
+        value: str | MyEnum = "default"
+
+    @dataclass
+    class EnumFirst:
+        value: MyEnum | str = "default"
+
+    # Unions compare equal regardless of their order, decoding must still follow each definition order
+    assert (str | MyEnum) == (MyEnum | str)
+
+    str_first = TypedState(state, StrFirst)
+    enum_first = TypedState(state, EnumFirst)
+    state[str_first.name.value] = MyEnum.B.value
+    state[enum_first.name.value] = MyEnum.B.value
+
+    for _ in range(2):
+        assert str_first.data.value == str(MyEnum.B.value)
+        assert enum_first.data.value == MyEnum.B
+
+
 def test_handles_list_of_union(state):
     encode = CustomEnumEncode()
     typed_state = TypedState(state, DataWithUnionTypes, encoders=[encode])
@@ -437,3 +563,203 @@ def test_failure_to_encode_raises_type_error(state):
 
     with pytest.raises(TypeError):
         print(typed_state.data.my_enum)
+
+
+def test_invalid_state_value_raises_type_error_with_default_encoders(state):
+    typed_state = TypedState(state, DataWithTypes)
+    state[typed_state.name.my_enum] = -1
+    state[typed_state.name.my_date] = "not a date"
+
+    with pytest.raises(TypeError):
+        print(typed_state.data.my_enum)
+
+    with pytest.raises(TypeError):
+        print(typed_state.data.my_date)
+
+
+def test_name_proxies_are_read_only(state):
+    typed_state = TypedState(state, MyBiggerData)
+
+    with pytest.raises(AttributeError):
+        typed_state.name.c = "other_name"
+
+    with pytest.raises(AttributeError):
+        typed_state.name.my_other_data.a = "other_name"
+
+
+def test_primitive_containers_are_copied_when_encoded(state):
+    typed_state = TypedState(state, MyData)
+
+    values = [1, 2.0, "3", True, None]
+    values_dict = {"a": 1, 2: None}
+    assert typed_state.encode(values) == values
+    assert typed_state.encode(values) is not values
+    assert typed_state.encode(values_dict) == values_dict
+    assert typed_state.encode(values_dict) is not values_dict
+    assert typed_state.encode([1, MyEnum.A]) == [1, MyEnum.A.value]
+
+
+def test_homogeneous_enum_lists_are_encoded_and_decoded(state):
+    typed_state = TypedState(state, DataWithTypes)
+    values = [MyEnum.A, MyEnum.B, MyEnum.C] * 1000
+
+    typed_state.data.my_enum_list = values
+    assert state[typed_state.name.my_enum_list] == [v.value for v in values]
+    assert typed_state.data.my_enum_list == values
+
+    state[typed_state.name.my_enum_list] = [MyEnum.A.value, -1]
+    with pytest.raises(TypeError):
+        print(typed_state.data.my_enum_list)
+
+
+def test_binding_data_proxies_does_not_keep_state_alive():
+    server = Server()
+    server.state.ready()
+    typed_state = TypedState(server.state, MyBiggerData)
+    typed_state.bind_changes({typed_state.data.my_other_data: MagicMock()})
+    state_ref = weakref.ref(server.state)
+
+    del typed_state, server
+    gc.collect()
+    assert state_ref() is None
+
+
+def test_can_encode_deeply_nested_containers(state):
+    typed_state = TypedState(state, MyData)
+
+    assert typed_state.encode(
+        {MyEnum.A: [(MyEnum.B, {"c": [MyEnum.C, 1]}), []], "d": ({},)}
+    ) == {
+        MyEnum.A.value: [(MyEnum.B.value, {"c": [MyEnum.C.value, 1]}), []],
+        "d": ({},),
+    }
+
+    nested = [MyEnum.A]
+    for _ in range(5000):
+        nested = [nested, MyEnum.B]
+
+    encoded = typed_state.encode(nested)
+    for _ in range(5000):
+        assert encoded[1] == MyEnum.B.value
+        encoded = encoded[0]
+    assert encoded == [MyEnum.A.value]
+
+
+def test_proxy_fields_of_a_dataclass_are_encoded_with_their_typed_state_encoder(state):
+    typed_state_1 = TypedState(state, MyDataWithDefaults, namespace="ns1")
+    typed_state_2 = TypedState(state, MyDataWithDefaults, namespace="ns2")
+    typed_state_3 = TypedState(
+        state, MyDataWithDefaults, namespace="ns3", encoders=[CustomEnumEncode()]
+    )
+
+    assert state[typed_state_1.name.a] == (MyEnum.A.value, MyEnum.C.value)
+    assert state[typed_state_2.name.a] == state[typed_state_1.name.a]
+    assert state[typed_state_3.name.a] == ("A_CUSTOM", "C_CUSTOM")
+
+    typed_state_2.data.b = [MyEnum.C]
+    typed_state_3.data.b = [MyEnum.C]
+    assert state[typed_state_1.name.b] == [MyEnum.B.value]
+    assert state[typed_state_2.name.b] == [MyEnum.C.value]
+    assert state[typed_state_3.name.b] == ["C_CUSTOM"]
+    assert typed_state_3.data.b == [MyEnum.C]
+
+
+def test_field_specs_do_not_keep_field_types_alive(state):
+    class LocalEnum(Enum):
+        A = auto()
+
+    @dataclass
+    class Local:
+        a: LocalEnum = LocalEnum.A
+
+    TypedState(state, Local, namespace="local")
+    ref = weakref.ref(LocalEnum)
+    del Local, LocalEnum
+
+    # Fill the bounded caches with other field types
+    for i in range(300):
+
+        class OtherEnum(Enum):
+            A = auto()
+
+        @dataclass
+        class Other:
+            a: OtherEnum = OtherEnum.A
+
+        TypedState(state, Other, namespace=f"other_{i}")
+
+    gc.collect()
+    assert ref() is None
+
+
+def test_collection_encoder_subclasses_encode_nested_items():
+    class NameCollectionEncoder(CollectionEncoderDecoder):
+        def encode(self, obj):
+            if isinstance(obj, MyEnum):
+                return obj.name
+            return super().encode(obj)
+
+    encoder = NameCollectionEncoder()
+    assert encoder.encode([MyEnum.A, [MyEnum.B]]) == ["A", ["B"]]
+    assert encoder.encode({MyEnum.A: (MyEnum.C,)}) == {"A": ("C",)}
+
+
+def test_binding_unknown_keys_fails_on_state_change_only(state):
+    typed_state = TypedState(state, MyData)
+
+    mock = MagicMock()
+    typed_state.bind_changes({(typed_state.name.a, "unknown_key"): mock})
+
+    typed_state.data.a = 3
+    with pytest.raises(KeyError):
+        state.flush()
+    mock.assert_not_called()
+
+
+def test_can_encode_mixed_nested_containers(state):
+    typed_state = TypedState(state, MyData)
+    uuid = uuid4()
+
+    assert typed_state.encode(
+        [
+            {"k": MyEnum.A, "v": [1, MyEnum.B, "x"]},
+            [MyEnum.A, 1, "x", None],
+            (uuid, Decimal("1.5"), [2.0, True]),
+            {1: {"a": [MyEnum.C]}},
+        ]
+    ) == [
+        {"k": MyEnum.A.value, "v": [1, MyEnum.B.value, "x"]},
+        [MyEnum.A.value, 1, "x", None],
+        (str(uuid), "1.5", [2.0, True]),
+        {1: {"a": [MyEnum.C.value]}},
+    ]
+
+
+def test_encoding_failures_of_nested_values_raise_type_errors(state):
+    class FailingDecimal(Decimal):
+        def __str__(self):
+            raise ValueError
+
+    typed_state = TypedState(state, MyData)
+
+    with pytest.raises(TypeError):
+        typed_state.encode(FailingDecimal("1"))
+
+    with pytest.raises(TypeError):
+        typed_state.encode([{"a": FailingDecimal("1")}, 1])
+
+
+def test_can_encode_homogeneous_containers(state):
+    typed_state = TypedState(state, MyData)
+
+    assert typed_state.encode([]) == []
+    assert typed_state.encode(()) == ()
+    assert typed_state.encode([[MyEnum.A], [MyEnum.B]]) == [
+        [MyEnum.A.value],
+        [MyEnum.B.value],
+    ]
+    assert typed_state.encode((Decimal(1), Decimal(2))) == ("1", "2")
+    assert typed_state.encode([{"a": 1}, {"b": MyEnum.C}]) == [
+        {"a": 1},
+        {"b": MyEnum.C.value},
+    ]
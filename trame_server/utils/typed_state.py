@@ -1,9 +1,13 @@
 import inspect
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import MISSING, Field, fields, is_dataclass
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter, methodcaller
 from pathlib import Path
 from types import UnionType
 from typing import (
@@ -11,6 +15,8 @@ from typing import (
     Callable,
     Generic,
     Iterable,
+    Iterator,
+    NamedTuple,
     Type,
     TypeVar,
     Union,
@@ -27,6 +33,49 @@ T = TypeVar("T")
 V = TypeVar("V")
 
 
+# Caches keyed on user types are bounded so that they don't keep every proxied type alive
+_TYPE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _fields_cached(dataclass_type: type) -> tuple[Field, ...]:
+    """
+    :return: Cached dataclass fields of the input dataclass type.
+    """
+    return fields(dataclass_type)
+
+
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _is_dataclass_cached(field_type: Any) -> bool:
+    """
+    :return: Cached is_dataclass result for the input field type.
+    """
+    return is_dataclass(field_type)
+
+
+_GET_ARGS_CACHE_SIZE = 1024
+_get_args_cache: dict[int, tuple[Any, tuple[Any, ...]]] = {}
+
+
+def _get_args_cached(obj_type: Any) -> tuple[Any, ...]:
+    """
+    :return: Cached typing arguments of the input generic type.
+
+    Cache is keyed on the type identity as unions compare equal regardless of their argument order
+    (str | Enum == Enum | str) while decoding depends on that order.
+    """
+    cached = _get_args_cache.get(id(obj_type))
+    if cached is not None and cached[0] is obj_type:
+        return cached[1]
+
+    if len(_get_args_cache) >= _GET_ARGS_CACHE_SIZE:
+        _get_args_cache.clear()
+
+    args = get_args(obj_type)
+    _get_args_cache[id(obj_type)] = (obj_type, args)
+    return args
+
+
 class _SerializationFailure:
     """
     Simple class to handle encoding / decoding failures
@@ -54,6 +103,18 @@ class IStateEncoderDecoder(ABC):
     def decode(self, obj, obj_type: type):
         pass
 
+    def can_encode(self, _obj) -> bool:
+        """
+        Cheap check called before encode. Returning False skips the encoder without trying to encode the value.
+        """
+        return True
+
+    def can_decode(self, _obj, _obj_type: type) -> bool:
+        """
+        Cheap check called before decode. Returning False skips the decoder without trying to decode the value.
+        """
+        return True
+
     @staticmethod
     def failed_serialization(reason: str = "") -> _SerializationFailure:
         return _SerializationFailure(reason)
@@ -63,33 +124,102 @@ class IStateEncoderDecoder(ABC):
         return not isinstance(value, _SerializationFailure)
 
 
+def _encode_datetime(obj: datetime) -> str:
+    return obj.astimezone(timezone.utc).isoformat()
+
+
+def _identity(obj):
+    return obj
+
+
+def _no_encoder(_obj_type: type) -> None:
+    return None
+
+
+# Encoders and decoders for exact types. Subclasses go through the isinstance / issubclass chains.
+_DEFAULT_ENCODERS: dict[type, Callable[[Any], Any]] = {
+    int: _identity,
+    float: _identity,
+    str: _identity,
+    bool: _identity,
+    type(None): _identity,
+    UUID: str,
+    Decimal: str,
+    datetime: _encode_datetime,
+    date: date.isoformat,
+    time: time.isoformat,
+    type(Path()): Path.as_posix,
+}
+
+_encode_enum = attrgetter("value")
+
+# Marker for containers whose items need to be encoded
+_NESTED_CONTAINER = object()
+
+# Types which are encoded as is by the default encoding
+_PRIMITIVE_TYPES = frozenset({int, float, str, bool, type(None)})
+
+_DEFAULT_DECODERS: dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+}
+
+
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _get_default_encoder(obj_type: type) -> Callable[[Any], Any] | None:
+    """
+    :return: Default encoding function for values of the input type. None for lists, tuples and dicts.
+    """
+    encode = _DEFAULT_ENCODERS.get(obj_type)
+    if encode is not None:
+        return encode
+
+    if issubclass(obj_type, (dict, list, tuple)):
+        return None
+    if issubclass(obj_type, UUID):
+        return str
+    if issubclass(obj_type, Enum):
+        return _encode_enum
+    if issubclass(obj_type, Decimal):
+        return str
+    if issubclass(obj_type, datetime):
+        return _encode_datetime
+    if issubclass(obj_type, (date, time)):
+        return methodcaller("isoformat")
+    if issubclass(obj_type, Path):
+        return methodcaller("as_posix")
+    return _identity
+
+
 class DefaultEncoderDecoder(IStateEncoderDecoder):
     """
     Default primitive type encoding/decoding.
     """
 
     def encode(self, obj):
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, Enum):
-            return obj.value
-        if isinstance(obj, Decimal):
-            return str(obj)
-        if isinstance(obj, datetime):
-            return obj.astimezone(timezone.utc).isoformat()
-        if isinstance(obj, date):
-            return obj.isoformat()
-        if isinstance(obj, time):
-            return obj.isoformat()
-        if isinstance(obj, Path):
-            return obj.as_posix()
-        return obj
+        encode = _get_default_encoder(type(obj))
+        if encode is None:
+            return obj
+        return encode(obj)
+
+    def can_decode(self, obj, obj_type: type) -> bool:
+        # Generic aliases and unions are handled by the CollectionEncoderDecoder.
+        # Subclasses overriding decode may support other targets (NewType, ...) and are always tried.
+        if type(self).decode is not DefaultEncoderDecoder.decode:
+            return True
+        return obj is None or isinstance(obj_type, type)
 
     def decode(self, obj, obj_type: type):
         if obj is None:
             return None
         if isinstance(obj, obj_type):
             return obj
+
+        decode = _DEFAULT_DECODERS.get(obj_type)
+        if decode is not None:
+            return decode(obj)
+
         if issubclass(obj_type, datetime):
             return obj_type.fromisoformat(obj)
         if issubclass(obj_type, date):
@@ -103,8 +233,8 @@ class DefaultEncoderDecoder(IStateEncoderDecoder):
 class CollectionEncoderDecoder(IStateEncoderDecoder):
     """
     Encoding/decoding for lists, tuples, dicts and type unions. Delegates to an encoder list for contained types.
-    Expects the encoder in its encoder list to return self.failed_serialization when encoding / decoding a specific
-    type is not possible.
+    Expects the encoder in its encoder list to return False in can_encode / can_decode, or to return
+    self.failed_serialization when encoding / decoding a specific type is not possible.
     If the delegate encoder raises an error, the error will be caught and considered as failed_serialization.
     Encoder will continue to the following encoder if the previous one wasn't able to encode / decode it.
 
@@ -113,26 +243,150 @@ class CollectionEncoderDecoder(IStateEncoderDecoder):
 
     def __init__(self, encoders: list[IStateEncoderDecoder] | None = None):
         self._encoders = encoders or [DefaultEncoderDecoder()]
+        self._is_default_encoding = type(self) is CollectionEncoderDecoder and all(
+            type(e) is DefaultEncoderDecoder for e in self._encoders
+        )
 
     def encode(self, obj):
-        if isinstance(obj, dict):
-            return {self.encode(key): self.encode(value) for key, value in obj.items()}
+        encoded = self._encode_value(obj)
+        if encoded is not _NESTED_CONTAINER:
+            return encoded
+
+        # Subclasses may override encode, container items are then encoded through it
+        if type(self) is not CollectionEncoderDecoder:
+            items = [self.encode(item) for item in self._iter_items(obj)]
+            return self._build_container(obj, items)
+
+        # Encode nested containers iteratively to avoid one Python frame per nesting level.
+        # Each stack entry holds the container, its encoded items and the iterator over its remaining items.
+        # Scalars are encoded inline with the default encoding.
+        get_scalar_encoder = (
+            _get_default_encoder if self._is_default_encoding else _no_encoder
+        )
+        stack = [(obj, [], self._iter_items(obj))]
+        while stack:
+            container, items, remaining_items = stack[-1]
+            for item in remaining_items:
+                encode_scalar = get_scalar_encoder(type(item))
+                if encode_scalar is not None:
+                    try:
+                        items.append(encode_scalar(item))
+                    except Exception as e:
+                        raise self._encode_error(item) from e
+                    continue
+
+                encoded = self._encode_value(item)
+                if encoded is _NESTED_CONTAINER:
+                    stack.append((item, [], self._iter_items(item)))
+                    break
+                items.append(encoded)
+            else:
+                stack.pop()
+                encoded = self._build_container(container, items)
+                if stack:
+                    stack[-1][1].append(encoded)
+
+        return encoded
 
-        if self._is_iterable(obj):
-            return type(obj)(self.encode(value) for value in obj)
+    def _encode_value(self, obj):
+        """
+        :return: Encoded value or _NESTED_CONTAINER if the input is a container whose items need to be encoded.
+        """
+        if self._is_default_encoding:
+            obj_type = type(obj)
+
+            # Scalars don't need to go through the encoder chain
+            encode = _get_default_encoder(obj_type)
+            if encode is not None:
+                try:
+                    return encode(obj)
+                except Exception as e:
+                    raise self._encode_error(obj) from e
+
+            if obj_type is list or obj_type is tuple or obj_type is dict:
+                encoded = self._encode_flat_container(obj)
+                if encoded is not _NESTED_CONTAINER:
+                    return encoded
+
+        if isinstance(obj, dict) or self._is_iterable(obj):
+            return _NESTED_CONTAINER
 
         for encoder in self._encoders:
+            if not encoder.can_encode(obj):
+                continue
             val = self._try_serialize(encoder.encode, obj)
             if self.is_serialization_success(val):
                 return val
 
+        raise self._encode_error(obj)
+
+    def _encode_error(self, obj) -> TypeError:
         _error_msg = f"Failed to encode object {obj}. No appropriate encoder in {self._encoders}."
-        raise TypeError(_error_msg)
+        return TypeError(_error_msg)
 
     @classmethod
     def _is_iterable(cls, obj):
         return isinstance(obj, list) or isinstance(obj, tuple)
 
+    @classmethod
+    def _iter_items(cls, obj) -> Iterator[Any]:
+        """
+        :return: Iterator over the list / tuple items or over the dict keys and values.
+        """
+        if isinstance(obj, dict):
+            return chain.from_iterable(obj.items())
+        return iter(obj)
+
+    @classmethod
+    def _build_container(cls, obj, items: list):
+        """
+        :return: Container of the same type as the input filled with the encoded items.
+        """
+        if isinstance(obj, dict):
+            return dict(zip(items[::2], items[1::2]))
+        return type(obj)(items)
+
+    def _encode_flat_container(self, obj):
+        """
+        Encodes lists, tuples and dicts whose items don't need to be encoded one by one with the default encoding.
+        Containers of primitives are only copied and lists and tuples of a single type are encoded with the
+        encoder of that type.
+
+        :return: Encoded container or _NESTED_CONTAINER if its items need to be encoded one by one.
+        """
+        if type(obj) is dict:
+            if all(type(key) in _PRIMITIVE_TYPES for key in obj) and all(
+                type(value) in _PRIMITIVE_TYPES for value in obj.values()
+            ):
+                return dict(obj)
+            return _NESTED_CONTAINER
+
+        # Single pass over the items for both the primitive and the single type checks
+        item_types = set(map(type, obj))
+        if item_types <= _PRIMITIVE_TYPES:
+            return type(obj)(obj)
+        if len(item_types) != 1:
+            return _NESTED_CONTAINER
+
+        encode_item = _get_default_encoder(item_types.pop())
+        if encode_item is None:
+            return _NESTED_CONTAINER
+        try:
+            return type(obj)(map(encode_item, obj))
+        except Exception as e:
+            raise self._encode_error(obj) from e
+
+    def _homogeneous_item_decoder(self, item_type) -> Callable[[Any], Any] | None:
+        """
+        :return: Default decoder for list or tuple items of the input type if available. None otherwise.
+        """
+        if not self._is_default_encoding or not isinstance(item_type, type):
+            return None
+
+        if issubclass(item_type, Enum):
+            return item_type
+        return _DEFAULT_DECODERS.get(item_type)
+
     def _try_serialize(self, f, *args):
         try:
             return f(*args)
@@ -164,6 +418,8 @@ class CollectionEncoderDecoder(IStateEncoderDecoder):
 
     def _delegate_decode(self, obj, obj_type: type):
         for encoder in self._encoders:
+            if not encoder.can_decode(obj, obj_type):
+                continue
             val = self._try_serialize(encoder.decode, obj, obj_type)
             if self.is_serialization_success(val):
                 return val
@@ -173,7 +429,7 @@ class CollectionEncoderDecoder(IStateEncoderDecoder):
         if not isinstance(obj, dict):
             return self.failed_serialization()
 
-        key_type, value_type = get_args(obj_type)
+        key_type, value_type = _get_args_cached(obj_type)
         return {
             self.decode(key, key_type): self.decode(value, value_type)
             for key, value in obj.items()
@@ -183,14 +439,20 @@ class CollectionEncoderDecoder(IStateEncoderDecoder):
         if not self._is_iterable(obj):
             return self.failed_serialization()
 
-        value_type = get_args(obj_type)[0]
+        value_type = _get_args_cached(obj_type)[0]
+        decode_item = self._homogeneous_item_decoder(value_type)
+        if decode_item is not None:
+            val = self._try_serialize(lambda: obj_type(map(decode_item, obj)))
+            if self.is_serialization_success(val):
+                return val
+
         return obj_type(self.decode(value, value_type) for value in obj)
 
     def _decode_union(self, obj, obj_type: type):
         if not self._is_union_type(obj_type):
             return self.failed_serialization()
 
-        for sub_union_type in get_args(obj_type):
+        for sub_union_type in _get_args_cached(obj_type):
             val = self._try_decode(obj, sub_union_type)
             if self.is_serialization_success(val):
                 return val
@@ -201,72 +463,199 @@ class CollectionEncoderDecoder(IStateEncoderDecoder):
         return get_origin(obj_type) is Union or isinstance(obj_type, UnionType)
 
 
+_DEFAULT_ENCODING = CollectionEncoderDecoder()
+
+
+def _has_default_encoding(encoder: IStateEncoderDecoder) -> bool:
+    """
+    :return: True if the input encoder only relies on the default encoding/decoding.
+    """
+    return type(encoder) is CollectionEncoderDecoder and encoder._is_default_encoding
+
+
+def _bind_encode(encoder: IStateEncoderDecoder) -> Callable[[Any], Any]:
+    """
+    :return: Encode callable for the input encoder.
+        When using the default encoding, exact primitive types are encoded without going through the encoder chain.
+    """
+    if not _has_default_encoding(encoder):
+        return encoder.encode
+
+    def encode(value):
+        type_encode = _DEFAULT_ENCODERS.get(type(value))
+        if type_encode is not None:
+            return type_encode(value)
+        return encoder.encode(value)
+
+    return encode
+
+
+def _bind_decode(
+    encoder: IStateEncoderDecoder, field_type: type
+) -> Callable[[Any], Any]:
+    """
+    :return: Decode callable for the input encoder and field type.
+        When using the default encoding and the field type is a plain class, values already of the field type are
+        returned as is and enums / dates are decoded directly. Other values go through the encoder chain.
+    """
+    if (
+        not _has_default_encoding(encoder)
+        or not isinstance(field_type, type)
+        or issubclass(field_type, (dict, list, tuple))
+    ):
+        return lambda value: encoder.decode(value, field_type)
+
+    type_decode = _DEFAULT_DECODERS.get(field_type)
+    if type_decode is None and issubclass(field_type, Enum):
+        type_decode = field_type
+
+    def decode(value):
+        if value is None or type(value) is field_type:
+            return value
+        if type_decode is not None:
+            try:
+                return type_decode(value)
+            except Exception:
+                pass
+        return encoder.decode(value, field_type)
+
+    return decode
+
+
+class _FieldSpec(NamedTuple):
+    """
+    Dataclass field information shared by the proxy fields created for this field.
+
+    :param encode: Bound encode callable for the field values.
+    :param decode: Bound decode callable for the field values.
+    :param default: Default value of the source field or MISSING.
+    :param encoded_default: Encoded default value shared by the proxy fields, MISSING if the field has no default or
+        if its encoded value is mutable.
+    :param default_factory: Default factory of the source field or MISSING.
+    """
+
+    encode: Callable[[Any], Any]
+    decode: Callable[[Any], Any]
+    default: Any
+    encoded_default: Any
+    default_factory: Any
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _create_field_spec(
+    field: Field, field_type: Any, encoder: IStateEncoderDecoder
+) -> _FieldSpec:
+    encode = _bind_encode(encoder)
+
+    # Only hashable encoded defaults are shared, mutable ones are encoded for each proxy field
+    encoded_default = MISSING
+    if field.default is not MISSING:
+        encoded_default = encode(field.default)
+        if not _is_hashable(encoded_default):
+            encoded_default = MISSING
+
+    return _FieldSpec(
+        encode,
+        _bind_decode(encoder, field_type),
+        field.default,
+        encoded_default,
+        field.default_factory,
+    )
+
+
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _create_default_field_spec(field: Field, field_type: Any) -> _FieldSpec:
+    return _create_field_spec(field, field_type, _DEFAULT_ENCODING)
+
+
+def _get_field_spec(
+    field: Field, field_type: Any, encoder: IStateEncoderDecoder
+) -> _FieldSpec:
+    """
+    :return: Field spec for the input field. Specs are shared between typed states using the default encoding.
+    """
+    if _has_default_encoding(encoder):
+        return _create_default_field_spec(field, field_type)
+    return _create_field_spec(field, field_type, encoder)
+
+
 class _ProxyField:
     """
-    Descriptor for proxy state fields to an equivalent dataclass field.
-    If the dataclass provides default, or a default factory, the associated state will be initialized to the given
-    encoded state value.
+    Proxy state field to an equivalent dataclass field. Exposed on the proxy classes as a property.
+    If the dataclass provides default, or a default factory, its encoded state value is available through
+    encoded_default for the state initialization.
 
     :param state: Trame State which will be mutated / read from.
     :param state_id: Associated trame string id where the data will be pushed / read from.
-    :param name: Name of the source field.
-    :param field_type: Type of the source field.
-    :param default: Default value of the source field.
-    :param default_factory: Default factory of the source field.
-    :param state_encoder: Encoder/decoder class for the proxy.
+    :param spec: Source field information and encoding.
     """
 
-    def __init__(
-        self,
-        *,
-        state: State,
-        state_id: str,
-        name: str,
-        field_type: type,
-        default,
-        default_factory,
-        state_encoder: IStateEncoderDecoder,
-    ):
+    __slots__ = ("_spec", "_state", "_state_id")
+
+    def __init__(self, *, state: State, state_id: str, spec: _FieldSpec):
         self._state = state
         self._state_id = state_id
-        self._name = name
-        self._default = default
-        self._encoder = state_encoder
-        self._type = field_type
+        self._spec = spec
+
+    def encoded_default(self):
+        """
+        :return: Encoded default value of the field or MISSING if the field has no default.
+        """
+        spec = self._spec
+        if spec.encoded_default is not MISSING:
+            return spec.encoded_default
+        if spec.default is not MISSING:
+            return spec.encode(spec.default)
+        # Default factories are called for each proxy as they may return mutable values
+        if spec.default_factory is not MISSING:
+            return spec.encode(spec.default_factory())
+        return MISSING
+
+    def as_property(self) -> property:
+        """
+        :return: Property reading / writing the field state value with the bound state, state id and encoder.
+            Avoids the descriptor and get_value / set_value indirections on each proxy attribute access.
+        """
+        state, state_id = self._state, self._state_id
+        encode, decode = self._spec.encode, self._spec.decode
 
-        # Set the default value to trame state if needed
-        default_value = default
-        if default_value == MISSING and default_factory != MISSING:
-            default_value = default_factory()
-        if default_value != MISSING:
-            self._state.setdefault(self._state_id, self._encoder.encode(default_value))
+        def get_value(_):
+            return decode(state[state_id])
 
-    def __get__(self, instance, owner):
-        return self.get_value()
+        def set_value(_, value):
+            state[state_id] = encode(value)
 
-    def __set__(self, instance, value):
-        self.set_value(value)
+        return property(get_value, set_value)
 
     def get_value(self):
-        value = self._state[self._state_id]
-        return self._encoder.decode(value, self._type)
+        return self._spec.decode(self._state[self._state_id])
 
     def set_value(self, value):
-        self._state[self._state_id] = self._encoder.encode(value)
+        self._state[self._state_id] = self._spec.encode(value)
 
 
-class _NameField:
+class _ProxyInfo(NamedTuple):
     """
-    Descriptor for fields to state id string equivalent.
+    Information attached to state proxy classes.
 
-    :param state_id: Associated trame string id where the data will be pushed / read from.
+    :param dataclass_type: Type of the dataclass the proxy was created from.
+    :param field_dict: State id to proxy field / nested proxy instance.
+    :param state_id: State id prefix of the proxy.
+    :param members: Dataclass field name, proxy field / nested proxy instance and whether it is a nested proxy, for
+        each field of the dataclass.
     """
 
-    def __init__(self, state_id: str):
-        self._state_id = state_id
-
-    def __get__(self, instance, owner):
-        return self._state_id
+    dataclass_type: type
+    field_dict: dict[str, Any]
+    state_id: str
+    members: tuple[tuple[str, Any, bool], ...]
 
 
 class TypedState(Generic[T]):
@@ -280,9 +669,7 @@ class TypedState(Generic[T]):
     - Use namespaces to avoid conflicts between different state objects
     """
 
-    _STATE_PROXY_DATACLASS_TYPE = "__state_proxy_dataclass_type"
-    _STATE_PROXY_FIELD_DICT = "__state_proxy_field_dict"
-    _STATE_PROXY_STATE_ID = "__state_proxy_state_id"
+    _PROXY_INFO = "__proxy_info__"
 
     def __init__(
         self,
@@ -365,19 +752,26 @@ class TypedState(Generic[T]):
             provided, will use a default encoder/decoder.
         """
         encoder = encoder or CollectionEncoderDecoder(None)
+        pending_defaults = {}
 
         def handler(state_id: str, field: Field, field_type: type):
-            return _ProxyField(
+            proxy_field = _ProxyField(
                 state=state,
                 state_id=state_id,
-                name=field.name,
-                default=field.default,
-                default_factory=field.default_factory,
-                field_type=field_type,
-                state_encoder=encoder,
+                spec=_get_field_spec(field, field_type, encoder),
             )
 
-        return cls._build_proxy_cls(dataclass_type, namespace, handler, "__Proxy")
+            default_value = proxy_field.encoded_default()
+            if default_value is not MISSING:
+                pending_defaults[state_id] = default_value
+            return proxy_field
+
+        proxy = cls._build_proxy_cls(dataclass_type, namespace, handler, "__Proxy")
+
+        # Initialize the state defaults once the full proxy hierarchy has been built
+        for state_id, default_value in pending_defaults.items():
+            state.setdefault(state_id, default_value)
+        return proxy
 
     @classmethod
     def _create_state_names_proxy(cls, dataclass_type: Type[T], *, namespace="") -> T:
@@ -390,8 +784,9 @@ class TypedState(Generic[T]):
             namespace prefix.
         """
 
+        # State ids are immutable strings and are stored directly as class attributes
         def handler(state_id: str, _field: Field, _field_type: type):
-            return _NameField(state_id=state_id)
+            return state_id
 
         return cls._build_proxy_cls(dataclass_type, namespace, handler, "__ProxyName")
 
@@ -419,15 +814,18 @@ class TypedState(Generic[T]):
         namespace = {}
         class_name = dataclass_type.__name__
         inner_field_dict = {}
-        prefix = f"{prefix}__{class_name}" if prefix else class_name
+        members = []
+        # State ids are used as keys in the state and field dicts, intern them to speed up their lookup
+        prefix = sys.intern(f"{prefix}__{class_name}" if prefix else class_name)
 
         # Use type hints instead of field.type to avoid lazy evaluation of field.type when used in files containing
         # from __future__ import annotations header.
         field_types = get_type_hints(dataclass_type)
-        for f in fields(dataclass_type):
-            state_id = f"{prefix}__{f.name}"
+        for f in _fields_cached(dataclass_type):
+            state_id = sys.intern(f"{prefix}__{f.name}")
             f_type = field_types[f.name]
-            if is_dataclass(f_type):
+            is_nested = _is_dataclass_cached(f_type)
+            if is_nested:
                 field = cls._build_proxy_cls(
                     f_type, state_id, handler, cls_suffix, inner_field_dict
                 )
@@ -435,15 +833,19 @@ class TypedState(Generic[T]):
                 field = handler(state_id, f, f_type)
 
             inner_field_dict[cls.get_state_id(field, state_id)] = field
-            namespace[f.name] = field
+            namespace[f.name] = (
+                field.as_property() if isinstance(field, _ProxyField) else field
+            )
+            members.append((f.name, field, is_nested))
 
         if proxy_field_dict is not None:
-            proxy_field_dict.update(**inner_field_dict)
+            proxy_field_dict.update(inner_field_dict)
 
         # Add dataclass type, fields and state id to the proxy class
-        namespace[cls._STATE_PROXY_DATACLASS_TYPE] = dataclass_type
-        namespace[cls._STATE_PROXY_FIELD_DICT] = inner_field_dict
-        namespace[cls._STATE_PROXY_STATE_ID] = prefix
+        namespace[cls._PROXY_INFO] = _ProxyInfo(
+            dataclass_type, inner_field_dict, prefix, tuple(members)
+        )
+        namespace["__slots__"] = ()
         proxy_cls = type(f"{class_name}{cls_suffix}", (), namespace)
 
         # Create the proxy instance and add instance to the accessible proxy fields
@@ -452,32 +854,48 @@ class TypedState(Generic[T]):
         return cast(T, proxy_instance)
 
     @classmethod
-    def _get_proxy_dataclass_type(cls, instance: T) -> Type[T] | None:
+    def _get_proxy_info(cls, instance: T) -> _ProxyInfo | None:
         """
-        :return: dataclass type attached to the input proxy instance.
+        :return: Proxy information attached to the input proxy instance class.
         """
-        return getattr(instance, cls._STATE_PROXY_DATACLASS_TYPE, None)
+        return getattr(type(instance), cls._PROXY_INFO, None)
 
     @classmethod
-    def _get_proxy_dataclass_type_or_raise(cls, instance: T) -> Type[T]:
+    def _get_proxy_info_or_raise(cls, instance: T) -> _ProxyInfo:
         """
-        :return: dataclass type attached to the proxy instance
+        :return: Proxy information attached to the input proxy instance class.
         :raises: RuntimeError if the input instance is not a proxy.
         """
-        kls = cls._get_proxy_dataclass_type(instance)
-        if kls is None:
+        info = cls._get_proxy_info(instance)
+        if info is None:
             _error_msg = (
                 f"Expected an instance of type __Proxy got {type(instance).__name__}."
             )
             raise RuntimeError(_error_msg)
-        return kls
+        return info
+
+    @classmethod
+    def _get_proxy_dataclass_type(cls, instance: T) -> Type[T] | None:
+        """
+        :return: dataclass type attached to the input proxy instance.
+        """
+        info = cls._get_proxy_info(instance)
+        return info.dataclass_type if info is not None else None
+
+    @classmethod
+    def _get_proxy_dataclass_type_or_raise(cls, instance: T) -> Type[T]:
+        """
+        :return: dataclass type attached to the proxy instance
+        :raises: RuntimeError if the input instance is not a proxy.
+        """
+        return cls._get_proxy_info_or_raise(instance).dataclass_type
 
     @classmethod
     def is_proxy_class(cls, instance: T) -> bool:
         """
         :return: True if the input instance is a state proxy type. False otherwise.
         """
-        return cls._get_proxy_dataclass_type(instance) is not None
+        return cls._get_proxy_info(instance) is not None
 
     @classmethod
     def is_name_proxy_class(cls, instance: T) -> bool:
@@ -497,52 +915,55 @@ class TypedState(Generic[T]):
         :return: State id string attached to the input state proxy or default if the input is not a state proxy
             instance.
         """
-        return getattr(instance, cls._STATE_PROXY_STATE_ID, default)
+        info = cls._get_proxy_info(instance)
+        return info.state_id if info is not None else default
 
     @classmethod
     def as_dataclass(cls, instance: T) -> T:
         """
         Converts the input state proxy instance to dataclass.
         """
-        dataclass_type = cls._get_proxy_dataclass_type_or_raise(instance)
+        info = cls._get_proxy_info_or_raise(instance)
 
         kwargs = {}
-        for f in fields(dataclass_type):
-            attr = getattr(instance, f.name)
-            if cls.is_proxy_class(attr):
-                kwargs[f.name] = cls.as_dataclass(attr)
+        for name, member, is_nested in info.members:
+            if is_nested:
+                kwargs[name] = cls.as_dataclass(member)
+            elif isinstance(member, _ProxyField):
+                kwargs[name] = member.get_value()
             else:
-                kwargs[f.name] = attr
+                kwargs[name] = member
 
-        return dataclass_type(**kwargs)
+        return info.dataclass_type(**kwargs)
 
     @classmethod
     def from_dataclass(cls, instance: T, dataclass_obj: T) -> None:
         """
         Populate the state proxy instance from the values of the given dataclass object.
         """
-        dataclass_type = cls._get_proxy_dataclass_type_or_raise(instance)
+        info = cls._get_proxy_info_or_raise(instance)
+        dataclass_type = info.dataclass_type
 
         if not isinstance(dataclass_obj, dataclass_type):
             _error_msg = f"Expected instance of {dataclass_type.__name__}, got {type(dataclass_obj).__name__}"
             raise TypeError(_error_msg)
 
-        for f in fields(dataclass_type):
-            attr = getattr(instance, f.name)
-            value = getattr(dataclass_obj, f.name)
+        for name, member, is_nested in info.members:
+            value = getattr(dataclass_obj, name)
 
-            if cls.is_proxy_class(attr):
-                cls.from_dataclass(attr, value)
+            if is_nested:
+                cls.from_dataclass(member, value)
+            elif isinstance(member, _ProxyField):
+                member.set_value(value)
             else:
-                setattr(instance, f.name, value)
+                setattr(instance, name, value)
 
     @classmethod
     def get_field_proxy_dict(cls, instance: T) -> dict[str, _ProxyField]:
         """
         :returns: State ID to ProxyField as saved in the input instance.
         """
-        cls._get_proxy_dataclass_type_or_raise(instance)
-        return getattr(instance, cls._STATE_PROXY_FIELD_DICT, {})
+        return cls._get_proxy_info_or_raise(instance).field_dict
 
     @classmethod
     def get_reactive_state_id_keys(cls, keys: Iterable[Any]) -> list[str]:
@@ -555,7 +976,7 @@ class TypedState(Generic[T]):
         react_keys = []
         for key in keys:
             if cls.is_proxy_class(key):
-                react_keys.extend(list(cls.get_field_proxy_dict(key).keys()))
+                react_keys.extend(cls.get_field_proxy_dict(key))
             else:
                 react_keys.append(key)
         return react_keys
@@ -593,11 +1014,34 @@ class TypedState(Generic[T]):
 
         value_keys = cls.get_value_state_keys(keys)
 
-        # On state change, get strongly typed values from the typed state and call the callback with the given values
-        def _on_state_change(**_):
-            values = [state_id_to_field_dict[k] for k in value_keys]
-            values = [v if cls.is_proxy_class(v) else v.get_value() for v in values]
-            return callback(*values)
+        def _get_value(key):
+            value = state_id_to_field_dict[key]
+            return value if cls.is_proxy_class(value) else value.get_value()
+
+        # Resolve the value getter of each key once. Nested proxies are passed as is, fields are decoded on access.
+        # Keys missing from the field dict are resolved on state change, as they were before getters were cached.
+        getters = []
+        for key in value_keys:
+            value = state_id_to_field_dict.get(key)
+            if value is None:
+                getters.append(lambda k=key: _get_value(k))
+            elif cls.is_proxy_class(value):
+                getters.append(lambda v=value: v)
+            else:
+                getters.append(value.get_value)
+
+        # On state change, get strongly typed values from the typed state and call the callback with the given values.
+        # Single key bindings being the most common, they call the callback without building an intermediate list.
+        if len(getters) == 1:
+            (getter,) = getters
+
+            def _on_state_change(**_):
+                return callback(getter())
+
+        else:
+
+            def _on_state_change(**_):
+                return callback(*[getter() for getter in getters])
 
         # Define an async variant for state change in case the bound method is async
         async def _on_state_change_async(**_):